@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for text_extractor.py.
+Measures cold start of the module and its CLI in fresh interpreters, and
+checks that an image-only run never pulls in the PDF backends.
+
+Usage: python benchmarks/import_time.py [--runs N]
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EAGER_IMPORTS = "import pytesseract, pdfplumber, fitz, tqdm; from PIL import Image"
+
+# Runs the real image path (extract_text -> extract_text_from_image ->
+# ocr_image, including detection) on an in-memory PNG, with pytesseract
+# replaced by a stub so no Tesseract binary is needed
+IMAGE_ONLY_CHECK = """
+import io, json, sys, types
+
+class TesseractError(Exception):
+    pass
+
+def image_to_osd(img, output_type=None):
+    raise TesseractError("stub")
+
+stub = types.ModuleType("pytesseract")
+stub.TesseractError = TesseractError
+stub.Output = types.SimpleNamespace(DICT="dict")
+stub.image_to_osd = image_to_osd
+stub.image_to_string = lambda img, lang=None, config="": "stub"
+stub.get_languages = lambda config="": ["eng"]
+sys.modules["pytesseract"] = stub
+
+from PIL import Image
+import text_extractor
+
+png = io.BytesIO()
+Image.new("RGB", (64, 64), "white").save(png, "PNG")
+png.seek(0)
+assert text_extractor.extract_text(png, ".png") == "stub"
+print(json.dumps(sorted(m for m in ("pdfplumber", "pdfminer", "fitz") if m in sys.modules)))
+"""
+
+
+def time_command(cmd, runs):
+    """Return the median wall time (ms) of *cmd* over *runs* fresh processes."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=REPO_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark text_extractor import time")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per measurement")
+    args = parser.parse_args()
+
+    python = sys.executable
+    cases = [
+        ("bare interpreter", [python, "-c", "pass"]),
+        ("import text_extractor", [python, "-c", "import text_extractor"]),
+        ("text_extractor.py --help", [python, "text_extractor.py", "--help"]),
+        ("eager backend imports", [python, "-c", EAGER_IMPORTS]),
+    ]
+    for label, cmd in cases:
+        print(f"{label:<28} {time_command(cmd, args.runs):8.1f} ms")
+
+    out = subprocess.check_output([python, "-c", IMAGE_ONLY_CHECK], cwd=REPO_DIR)
+    loaded = json.loads(out)
+    if loaded:
+        print(f"✗ Image-only run imported PDF backends: {', '.join(loaded)}")
+        sys.exit(1)
+    print("✓ Image-only run did not import pdfplumber, pdfminer or fitz")
+
+
+if __name__ == "__main__":
+    main()
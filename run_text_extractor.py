@@ -7,7 +7,13 @@ Cross-platform equivalent of run_text_extractor.sh.
 
 import os
 import sys
+import json
+import site
 import shutil
+import hashlib
+import argparse
+import importlib
+import importlib.util
 import subprocess
 import platform
 
@@ -56,6 +62,16 @@ def print_info(msg):     print(f"{_C.CYAN}ℹ {msg}{_C.NC}")
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 VENV_DIR   = os.path.join(SCRIPT_DIR, "venv")
+STAMP_FILE = os.path.join(SCRIPT_DIR, ".env_verified.json")
+
+# import name -> pip distribution name
+REQUIRED_PACKAGES = {
+    "pytesseract": "pytesseract",
+    "PIL":         "Pillow",
+    "pdfplumber":  "pdfplumber",
+    "tqdm":        "tqdm",
+    "fitz":        "PyMuPDF",
+}
 
 # ─── Dependency checks ───────────────────────────────────────────────────
 
@@ -77,15 +93,10 @@ def check_python():
 def check_pip():
     """Check that pip is available."""
     print_section("Checking pip Installation")
-    try:
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "--version"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+    if importlib.util.find_spec("pip") is not None:
         print_success("pip is installed")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         print_error("pip is not available for the current Python interpreter")
         print_info("Install pip: https://pip.pypa.io/en/stable/installation/")
         return False
@@ -196,34 +207,97 @@ def _create_venv() -> bool:
         return False
 
 
-def _check_package(package: str) -> bool:
-    """Return True if *package* is importable by the target Python."""
+def _probe_environment() -> dict:
+    """Describe the running interpreter without importing any package."""
+    from importlib import metadata
+
+    found = {}
+    for import_name in REQUIRED_PACKAGES:
+        try:
+            found[import_name] = importlib.util.find_spec(import_name) is not None
+        except (ImportError, ValueError):
+            found[import_name] = False
+
+    versions = {}
+    for pip_name in REQUIRED_PACKAGES.values():
+        try:
+            versions[pip_name] = metadata.version(pip_name)
+        except metadata.PackageNotFoundError:
+            versions[pip_name] = None
+
+    return {
+        "executable": sys.executable,
+        "python": sys.version,
+        "found": found,
+        "versions": versions,
+    }
+
+
+def probe_environment() -> dict:
+    """Probe the target Python in one go (in-process when it is this one)."""
+    python = _python_cmd()
+    if os.path.realpath(python) == os.path.realpath(sys.executable):
+        importlib.invalidate_caches()
+        return _probe_environment()
+    code = (
+        "import json, sys; sys.path.insert(0, sys.argv[1]); "
+        "import run_text_extractor as r; print(json.dumps(r._probe_environment()))"
+    )
     try:
-        subprocess.check_call(
-            [_python_cmd(), "-c", f"import {package}"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        out = subprocess.check_output([python, "-c", code, SCRIPT_DIR], stderr=subprocess.DEVNULL)
+        return json.loads(out)
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return {
+            "executable": python,
+            "python": None,
+            "found": {name: False for name in REQUIRED_PACKAGES},
+            "versions": {name: None for name in REQUIRED_PACKAGES.values()},
+        }
+
+
+def _environment_key(probe: dict) -> str:
+    """Hash the interpreter, package versions and tesseract binary."""
+    tess = shutil.which("tesseract")
+    try:
+        tess_mtime = os.stat(tess).st_mtime if tess else None
+    except OSError:
+        tess_mtime = None
+    payload = {
+        "executable": probe["executable"],
+        "python": probe["python"],
+        "versions": probe["versions"],
+        "tesseract": [tess, tess_mtime],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def environment_is_verified(probe: dict) -> bool:
+    """Return True if the stamp matches the current environment."""
+    if not all(probe["found"].values()):
+        return False
+    try:
+        with open(STAMP_FILE, encoding="utf-8") as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
         return False
+    return stamp.get("key") == _environment_key(probe)
 
 
-def install_python_packages() -> bool:
+def write_environment_stamp(probe: dict):
+    try:
+        with open(STAMP_FILE, "w", encoding="utf-8") as f:
+            json.dump({"key": _environment_key(probe)}, f)
+    except OSError:
+        pass  # Read-only install; we simply check again next time
+
+
+def install_python_packages(probe: dict) -> bool:
     """Check required packages and install any that are missing."""
     print_section("Checking Python Dependencies")
 
-    required = {
-        "pytesseract": "pytesseract",
-        "PIL":         "Pillow",
-        "pdfplumber":  "pdfplumber",
-        "tqdm":        "tqdm",
-        "fitz":        "PyMuPDF",
-    }
-
     missing_pip: list[str] = []
-    for import_name, pip_name in required.items():
-        if _check_package(import_name):
+    for import_name, pip_name in REQUIRED_PACKAGES.items():
+        if probe["found"].get(import_name):
             print_success(f"{import_name} is installed")
         else:
             print_warning(f"{import_name} is not installed")
@@ -237,6 +311,10 @@ def install_python_packages() -> bool:
 
     # Try --user install first
     if _pip_install(missing_pip, use_user=True):
+        # A user site-packages created just now is not on sys.path yet
+        if _python_cmd() == sys.executable and site.ENABLE_USER_SITE:
+            site.addsitedir(site.getusersitepackages())
+            importlib.invalidate_caches()
         print_success("All Python packages installed successfully")
         return True
 
@@ -263,14 +341,25 @@ def show_menu():
     print()
 
 
-def launch_gui():
+def _runs_in_process(probe: dict) -> bool:
+    """The tool can run inside this interpreter if it is the target Python
+    and every required package is importable from it."""
+    same_python = os.path.realpath(_python_cmd()) == os.path.realpath(sys.executable)
+    return same_python and all(probe["found"].values())
+
+
+def launch_gui(in_process: bool):
     print_section("Launching GUI Mode")
     print_info("Starting Text Extractor GUI...")
     os.chdir(SCRIPT_DIR)
+    if in_process:
+        import text_extractor_gui
+        text_extractor_gui.main()
+        return
     subprocess.call([_python_cmd(), os.path.join(SCRIPT_DIR, "text_extractor_gui.py")])
 
 
-def launch_cli():
+def launch_cli(in_process: bool):
     print_section("Launching CLI Mode")
     print()
     try:
@@ -289,37 +378,63 @@ def launch_cli():
 
     print_info(f"Processing: {input_path}")
     os.chdir(SCRIPT_DIR)
+    if in_process:
+        import text_extractor
+        try:
+            text_extractor.main([input_path])
+        except SystemExit:
+            pass
+        except Exception as e:
+            print_error(str(e))
+        return
     subprocess.call([_python_cmd(), os.path.join(SCRIPT_DIR, "text_extractor.py"), input_path])
 
 
 # ─── Main ─────────────────────────────────────────────────────────────────
 
 def main():
+    parser = argparse.ArgumentParser(description="Text Extractor Tool launcher")
+    parser.add_argument("--recheck", action="store_true",
+                        help="Ignore the cached environment check and verify all dependencies")
+    args = parser.parse_args()
+
     # Clear screen (cross-platform)
     os.system("cls" if platform.system() == "Windows" else "clear")
 
     print_banner()
-    print_info("Checking system requirements...")
-    print()
 
-    checks_passed = True
+    probe = probe_environment()
+    if not args.recheck and environment_is_verified(probe):
+        print_success("Environment unchanged since last check, skipping dependency checks")
+    else:
+        print_info("Checking system requirements...")
+        print()
+
+        checks_passed = True
 
-    if not check_python():
-        checks_passed = False
-    if not check_pip():
-        checks_passed = False
-    if not check_tesseract():
-        checks_passed = False
-    if not install_python_packages():
-        checks_passed = False
+        if not check_python():
+            checks_passed = False
+        if not check_pip():
+            checks_passed = False
+        if not check_tesseract():
+            checks_passed = False
+        if not install_python_packages(probe):
+            checks_passed = False
+
+        if not checks_passed:
+            print()
+            print_error("Some dependencies are missing. Please install them manually and run this script again.")
+            sys.exit(1)
+
+        # Packages may have been installed (possibly into a new venv)
+        probe = probe_environment()
+        if all(probe["found"].values()):
+            write_environment_stamp(probe)
 
-    if not checks_passed:
         print()
-        print_error("Some dependencies are missing. Please install them manually and run this script again.")
-        sys.exit(1)
+        print_success("All dependencies are installed!")
 
-    print()
-    print_success("All dependencies are installed!")
+    in_process = _runs_in_process(probe)
 
     # Main loop
     while True:
@@ -333,11 +448,11 @@ def main():
             break
 
         if choice == "1":
-            launch_gui()
+            launch_gui(in_process)
             print()
             print_info("GUI closed. Returning to menu...")
         elif choice == "2":
-            launch_cli()
+            launch_cli(in_process)
             print()
             print_info("Processing complete. Returning to menu...")
         elif choice == "3":
@@ -1,51 +1,170 @@
+import io
 import os
 import sys
+import json
+import hashlib
 import shutil
 import logging
-from pathlib import Path
-from typing import Union
-
-try:
-    import pytesseract
-except ImportError:
-    pytesseract = None
-
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
-
-try:
-    import pdfplumber
-except ImportError:
-    pdfplumber = None
-
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    fitz = None
-
-try:
-    from tqdm import tqdm
-except ImportError:
-    tqdm = None
+import tarfile
+import zipfile
+import tempfile
+import functools
+import importlib
+import importlib.util
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Callable, Iterator, Tuple, Union
+
+# Heavy backends are imported on first use so that `--help`, image-only
+# runs and worker processes only pay for what they actually need.
+_INSTALL_HINTS = {
+    "pytesseract": "pytesseract is not installed. Please install it with 'pip install pytesseract'.",
+    "PIL.Image": "Pillow is not installed. Please install it with 'pip install pillow'.",
+    "pdfplumber": "pdfplumber is not installed. Please install it with 'pip install pdfplumber'.",
+    "fitz": "PyMuPDF (fitz) is required for OCR on scanned PDFs. Please install it with 'pip install pymupdf'.",
+    "tqdm": "tqdm is not installed. Please install it with 'pip install tqdm'.",
+    "pyarrow": "pyarrow is required for Parquet output. Please install it with 'pip install pyarrow'.",
+    "pyarrow.parquet": "pyarrow is required for Parquet output. Please install it with 'pip install pyarrow'.",
+}
+
+@functools.lru_cache(maxsize=None)
+def _backend(module_name: str):
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        raise ImportError(_INSTALL_HINTS[module_name]) from None
+
+def _tqdm():
+    try:
+        return _backend("tqdm").tqdm
+    except ImportError:
+        return None
 
 def check_tesseract_installed():
-    if pytesseract is None:
-        raise ImportError("pytesseract is not installed. Please install it with 'pip install pytesseract'.")
+    if importlib.util.find_spec("pytesseract") is None:
+        raise ImportError(_INSTALL_HINTS["pytesseract"])
     if shutil.which("tesseract") is None:
         raise EnvironmentError("Tesseract OCR is not installed or not in PATH. Please install it from https://github.com/tesseract-ocr/tesseract")
 
-def extract_text_from_image(image_path: Union[str, Path]) -> str:
-    if Image is None:
-        raise ImportError("Pillow is not installed. Please install it with 'pip install pillow'.")
+IMAGE_SUFFIXES = [".jpg", ".jpeg", ".png", ".bmp", ".tiff"]
+SUPPORTED_SUFFIXES = IMAGE_SUFFIXES + [".pdf"]
+# Longest first so ".tar.gz" wins over ".tar" when stripping the suffix
+ARCHIVE_SUFFIXES = (".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tbz2", ".txz", ".tar", ".zip")
+# Archive members and stdin are buffered in memory up to this size, then
+# spill to an anonymous temporary file
+SPOOL_MAX_BYTES = 64 * 1024 * 1024
+# Packed output: records are flushed to the open shard in batches, and a
+# new shard is started every SHARD_RECORDS records
+PACK_BATCH_RECORDS = 1000
+SHARD_RECORDS = 100_000
+
+# Per-page OCR configuration. Script/orientation (OSD) and layout are
+# detected on a downscaled grayscale thumbnail, then the full page is OCRed
+# with only the language models and page segmentation mode it needs.
+DETECT_MAX_SIDE = 1024
+# Layout is measured inside the ink bounding box: a page is sparse only if
+# few of its rows carry ink *and* its text lines are short (forms, labels)
+DENSE_ROW_FRACTION = 0.4
+DENSE_LINE_COVERAGE = 0.5
+# OSD guesses below these confidences are ignored (too little text)
+OSD_MIN_ORIENTATION_CONF = 2.0
+OSD_MIN_SCRIPT_CONF = 1.0
+SCRIPT_LANGUAGES = {"Latin": "eng", "Sinhala": "sin", "Tamil": "tam"}
+DEFAULT_PAGE_CONFIG = {"lang": None, "psm": 3, "rotate": 0}
+
+@functools.lru_cache(maxsize=None)
+def _installed_languages() -> frozenset:
+    try:
+        return frozenset(_backend("pytesseract").get_languages(config=""))
+    except Exception:
+        return frozenset()
+
+def _detect_orientation(thumb):
+    pytesseract = _backend("pytesseract")
+    try:
+        osd = pytesseract.image_to_osd(thumb, output_type=pytesseract.Output.DICT)
+    except pytesseract.TesseractError:
+        return None, 0  # No OSD model, or too little text to decide
+    script = osd.get("script") if osd.get("script_conf", 0) >= OSD_MIN_SCRIPT_CONF else None
+    rotate = int(osd.get("rotate", 0)) if osd.get("orientation_conf", 0) >= OSD_MIN_ORIENTATION_CONF else 0
+    return script, rotate
+
+def _detect_psm(thumb) -> int:
+    Image = _backend("PIL.Image")
+    ink = thumb.point(lambda p: 255 if p < 128 else 0)
+    bbox = ink.getbbox()
+    if bbox is None:
+        return DEFAULT_PAGE_CONFIG["psm"]
+    ink = ink.crop(bbox)
+
+    # One byte per row: mean ink of that row
+    inked = [value > 0 for value in ink.resize((1, ink.height), resample=Image.BOX).tobytes()]
+    if sum(inked) >= DENSE_ROW_FRACTION * len(inked):
+        return 3
+
+    # Few inked rows (letters with gaps, forms): look at how far text lines
+    # run across the box, sampled in 32 columns per line
+    coverage = []
+    start = None
+    for y, on in enumerate(inked + [False]):
+        if on and start is None:
+            start = y
+        elif not on and start is not None:
+            line = ink.crop((0, start, ink.width, y)).resize((32, 1), resample=Image.BOX).tobytes()
+            coverage.append(sum(1 for value in line if value) / 32)
+            start = None
+    median = sorted(coverage)[len(coverage) // 2]
+    return 3 if median >= DENSE_LINE_COVERAGE else 11
+
+def detect_page_config(img, document: dict = None) -> dict:
+    """Detect the OCR configuration of one page.
+
+    Rotation and psm are always per page. *document* carries state across
+    the pages of one document: the last script OSD recognised is reused
+    for pages where OSD cannot decide (e.g. too little text).
+    """
+    thumb = img.convert("L")
+    thumb.thumbnail((DETECT_MAX_SIDE, DETECT_MAX_SIDE))
+
+    script, rotate = _detect_orientation(thumb)
+    if document is not None:
+        if script:
+            document["script"] = script
+        else:
+            script = document.get("script")
+    if rotate:
+        thumb = thumb.rotate(-rotate, expand=True, fillcolor=255)
+
+    installed = _installed_languages()
+    lang = SCRIPT_LANGUAGES.get(script)
+    if lang not in installed:
+        lang = None
+    elif lang != "eng" and "eng" in installed:
+        lang += "+eng"  # Mixed documents still carry English text
+    return {"lang": lang, "psm": _detect_psm(thumb), "rotate": rotate}
+
+def ocr_image(img, page_config: dict = None) -> str:
+    pytesseract = _backend("pytesseract")
+    if page_config is None:
+        page_config = detect_page_config(img)
+    if page_config["rotate"]:
+        img = img.rotate(-page_config["rotate"], expand=True, fillcolor="white")
+    return pytesseract.image_to_string(
+        img, lang=page_config["lang"], config=f"--psm {page_config['psm']}"
+    )
+
+def extract_text_from_image(image_path: Union[str, Path, BinaryIO], detect: bool = True) -> str:
+    Image = _backend("PIL.Image")
     img = Image.open(image_path)
-    text = pytesseract.image_to_string(img)
-    return text
+    return ocr_image(img, None if detect else DEFAULT_PAGE_CONFIG)
+
+def _open_fitz(fitz, pdf_path: Union[str, Path, BinaryIO]):
+    if hasattr(pdf_path, "read"):
+        pdf_path.seek(0)
+        return fitz.open(stream=pdf_path.read(), filetype="pdf")
+    return fitz.open(pdf_path)
 
-def extract_text_from_pdf(pdf_path: Union[str, Path]) -> str:
-    if pdfplumber is None:
-        raise ImportError("pdfplumber is not installed. Please install it with 'pip install pdfplumber'.")
+def extract_text_from_pdf(pdf_path: Union[str, Path, BinaryIO], detect: bool = True) -> str:
+    pdfplumber = _backend("pdfplumber")
     text = ""
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
@@ -54,32 +173,39 @@ def extract_text_from_pdf(pdf_path: Union[str, Path]) -> str:
                 text += page_text + "\n"
             else:
                 # Fallback to OCR if page is scanned
-                if fitz is None:
-                    raise ImportError("PyMuPDF (fitz) is required for OCR on scanned PDFs. Please install it with 'pip install pymupdf'.")
-                doc = fitz.open(pdf_path)
+                fitz = _backend("fitz")
+                Image = _backend("PIL.Image")
+                document = {}
+                doc = _open_fitz(fitz, pdf_path)
                 for page_num in range(len(doc)):
                     pix = doc[page_num].get_pixmap()
                     img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    text += pytesseract.image_to_string(img) + "\n"
+                    page_config = detect_page_config(img, document) if detect else DEFAULT_PAGE_CONFIG
+                    text += ocr_image(img, page_config) + "\n"
                 break  # Already processed all pages with fitz
     return text
 
+def extract_text(source: Union[str, Path, BinaryIO], suffix: str, detect: bool = True) -> str:
+    if suffix.lower() in IMAGE_SUFFIXES:
+        return extract_text_from_image(source, detect=detect)
+    elif suffix.lower() == ".pdf":
+        return extract_text_from_pdf(source, detect=detect)
+    else:
+        raise ValueError(f"Unsupported file type: {suffix}")
+
 def save_text(text: str, output_path: Path):
     with open(output_path, "w", encoding="utf-8") as f:
         f.write(text)
 
-def process_file(file_path: Path, logger=None):
+def process_file(file_path: Path, logger=None, detect=True, output=None):
     try:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
-        if file_path.suffix.lower() in [".jpg", ".jpeg", ".png", ".bmp", ".tiff"]:
-            text = extract_text_from_image(file_path)
-        elif file_path.suffix.lower() == ".pdf":
-            text = extract_text_from_pdf(file_path)
+        text = extract_text(file_path, file_path.suffix, detect=detect)
+        if output:
+            output.write(file_path.name, text, source=str(file_path.resolve()))
         else:
-            raise ValueError(f"Unsupported file type: {file_path.suffix}")
-        output_path = file_path.with_suffix(".txt")
-        save_text(text, output_path)
+            save_text(text, file_path.with_suffix(".txt"))
         if logger:
             logger.info(f"Success: {file_path}")
         return True
@@ -88,17 +214,307 @@ def process_file(file_path: Path, logger=None):
             logger.error(f"Failed: {file_path} - {e}")
         return False
 
-def process_folder(folder_path: Path, logger=None, show_progress=True):
-    files = [f for f in folder_path.iterdir() if f.is_file() and f.suffix.lower() in [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".pdf"]]
-    iterator = tqdm(files, desc="Processing") if tqdm and show_progress else files
+def process_folder(folder_path: Path, logger=None, show_progress=True, detect=True, output=None):
+    files = [f for f in folder_path.iterdir() if f.is_file() and f.suffix.lower() in SUPPORTED_SUFFIXES]
+    tqdm = _tqdm() if show_progress else None
+    iterator = tqdm(files, desc="Processing") if tqdm else files
     for file_path in iterator:
-        process_file(file_path, logger=logger)
+        process_file(file_path, logger=logger, detect=detect, output=output)
+
+def is_archive(path: Path) -> bool:
+    return path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+def _archive_stem(path: Path) -> str:
+    for suffix in ARCHIVE_SUFFIXES:
+        if path.name.lower().endswith(suffix):
+            return path.name[:-len(suffix)]
+    return path.stem
+
+def _spool(stream) -> BinaryIO:
+    buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    shutil.copyfileobj(stream, buffer)
+    buffer.seek(0)
+    return buffer
+
+def _is_archive_stream(fileobj: BinaryIO) -> bool:
+    try:
+        if zipfile.is_zipfile(fileobj):
+            return True
+        fileobj.seek(0)
+        try:
+            tarfile.open(fileobj=fileobj, mode="r:*").close()
+            return True
+        except tarfile.TarError:
+            return False
+    finally:
+        fileobj.seek(0)
+
+def _spool_member(open_member, info) -> BinaryIO:
+    with open_member(info) as member:
+        return _spool(member)
+
+def iter_archive_members(fileobj: BinaryIO) -> Iterator[Tuple[str, Callable[[], BinaryIO]]]:
+    """Yield (member name, opener) for each supported archive member.
+
+    Calling the opener reads the member into a seekable buffer, so a
+    corrupt, encrypted or unsupported member fails there rather than in
+    the iteration. Zip archives need a seekable *fileobj*; tar archives
+    are read as a stream, so each opener must be called (if at all)
+    before the next member is requested.
+    """
+    if zipfile.is_zipfile(fileobj):
+        fileobj.seek(0)
+        with zipfile.ZipFile(fileobj) as zf:
+            for info in zf.infolist():
+                if info.is_dir() or PurePosixPath(info.filename).suffix.lower() not in SUPPORTED_SUFFIXES:
+                    continue
+                yield info.filename, functools.partial(_spool_member, zf.open, info)
+        return
+    fileobj.seek(0)
+    with tarfile.open(fileobj=fileobj, mode="r|*") as tf:
+        for info in tf:
+            if not info.isfile() or PurePosixPath(info.name).suffix.lower() not in SUPPORTED_SUFFIXES:
+                continue
+            yield info.name, functools.partial(_spool_member, tf.extractfile, info)
+
+def _member_output_name(name: str) -> PurePosixPath:
+    # Drop absolute and parent components so members cannot escape the output
+    parts = [part for part in PurePosixPath(name).parts if part not in ("/", ".", "..")]
+    return PurePosixPath(*parts).with_suffix(".txt")
+
+class ArchiveOutput:
+    """Collects extracted text as `<member>.txt` entries of a zip or tar archive."""
+
+    def __init__(self, path: Path):
+        name = path.name.lower()
+        if name.endswith(".zip"):
+            self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+            self._tar = None
+        elif is_archive(path):
+            compression = {".gz": "gz", ".tgz": "gz", ".bz2": "bz2", ".tbz2": "bz2", ".xz": "xz", ".txz": "xz"}
+            self._zip = None
+            self._tar = tarfile.open(path, "w:" + compression.get(Path(name).suffix, ""))
+        else:
+            raise ValueError(f"Unsupported output archive type: {path.name}")
+
+    def write(self, name: str, text: str, source: str = None):
+        arcname = str(_member_output_name(name))
+        data = text.encode("utf-8")
+        if self._zip:
+            self._zip.writestr(arcname, data)
+        else:
+            info = tarfile.TarInfo(arcname)
+            info.size = len(data)
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        (self._zip or self._tar).close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class OutputDirectory:
+    """Writes `<name>.txt` files under *root*, optionally hash-sharded.
+
+    With *shard_depth* N, each file goes N levels deep into two-hex-digit
+    directories taken from the SHA-1 of its name (256 entries per level).
+    """
 
-def setup_logger(log_file: Path = None):
+    def __init__(self, root: Path, shard_depth: int = 0):
+        self.root = root
+        self.shard_depth = shard_depth
+        self._created = set()
+
+    def write(self, name: str, text: str, source: str = None):
+        relative = _member_output_name(name)
+        if self.shard_depth:
+            digest = hashlib.sha1(name.encode("utf-8")).hexdigest()
+            shards = [digest[2 * i:2 * i + 2] for i in range(self.shard_depth)]
+            relative = PurePosixPath(*shards) / relative
+        output_path = self.root.joinpath(*relative.parts)
+        if output_path.parent not in self._created:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._created.add(output_path.parent)
+        save_text(text, output_path)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class PackedOutput:
+    """Packs results as `{"source", "text"}` records into JSONL or Parquet shards.
+
+    Records are buffered and written in batches of *batch_records*;
+    shards are named `part-00000.jsonl` (or `.parquet`) under *root*.
+    `source` is the absolute input path for files and the member path for
+    archive members. A *root* that already holds shards is refused, so a
+    re-run can never mix new shards with stale ones.
+    """
+
+    def __init__(self, root: Path, fmt: str = "jsonl", shard_records: int = SHARD_RECORDS,
+                 batch_records: int = PACK_BATCH_RECORDS):
+        if fmt not in ("jsonl", "parquet"):
+            raise ValueError(f"Unsupported pack format: {fmt}")
+        if fmt == "parquet":
+            # Fail before any work is done rather than on the first flush
+            _backend("pyarrow")
+            _backend("pyarrow.parquet")
+        self.root = root
+        self.fmt = fmt
+        self.shard_records = shard_records
+        self.batch_records = min(batch_records, shard_records)
+        self._batch = []
+        self._shard = None
+        self._shard_index = 0
+        self._shard_count = 0
+        root.mkdir(parents=True, exist_ok=True)
+        existing = sorted(root.glob("part-*.jsonl")) + sorted(root.glob("part-*.parquet"))
+        if existing:
+            raise FileExistsError(f"{root} already contains output shards ({existing[0].name}, ...); "
+                                  "remove them or choose another --output-dir")
+
+    def write(self, name: str, text: str, source: str = None):
+        self._batch.append((source or name, text))
+        if (len(self._batch) >= self.batch_records
+                or self._shard_count + len(self._batch) >= self.shard_records):
+            self._flush()
+
+    def _open_shard(self):
+        path = self.root / f"part-{self._shard_index:05d}.{self.fmt}"
+        self._shard_index += 1
+        self._shard_count = 0
+        if self.fmt == "jsonl":
+            self._shard = open(path, "w", encoding="utf-8", buffering=1024 * 1024)
+        else:
+            pa = _backend("pyarrow")
+            schema = pa.schema([("source", pa.string()), ("text", pa.string())])
+            self._shard = _backend("pyarrow.parquet").ParquetWriter(path, schema)
+
+    def _flush(self):
+        if not self._batch:
+            return
+        if self._shard is None:
+            self._open_shard()
+        if self.fmt == "jsonl":
+            self._shard.write("".join(
+                json.dumps({"source": name, "text": text}, ensure_ascii=False) + "\n"
+                for name, text in self._batch
+            ))
+        else:
+            sources, texts = zip(*self._batch)
+            table = _backend("pyarrow").table({"source": list(sources), "text": list(texts)})
+            self._shard.write_table(table)
+        self._shard_count += len(self._batch)
+        self._batch = []
+        if self._shard_count >= self.shard_records:
+            self._shard.close()
+            self._shard = None
+
+    def close(self):
+        self._flush()
+        if self._shard is not None:
+            self._shard.close()
+            self._shard = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_output(output_dir: Path = None, output_archive: Path = None, shard_depth: int = 0,
+                pack: str = None, shard_records: int = SHARD_RECORDS):
+    """Return the output for the given options, or None to write next to the sources."""
+    if output_archive:
+        return ArchiveOutput(output_archive)
+    if output_dir and pack:
+        return PackedOutput(output_dir, pack, shard_records=shard_records)
+    if output_dir:
+        return OutputDirectory(output_dir, shard_depth=shard_depth)
+    return None
+
+def _process_members(members, write, label, logger=None, show_progress=True, detect=True):
+    tqdm = _tqdm() if show_progress else None
+    iterator = tqdm(members, desc="Processing", unit="file") if tqdm else members
+    for name, open_member in iterator:
+        try:
+            with open_member() as buffer:
+                text = extract_text(buffer, PurePosixPath(name).suffix, detect=detect)
+            write(name, text)
+            if logger:
+                logger.info(f"Success: {label}:{name}")
+        except Exception as e:
+            if logger:
+                logger.error(f"Failed: {label}:{name} - {e}")
+
+def process_archive(archive_path: Path, logger=None, show_progress=True, detect=True, output=None):
+    """Extract text from every supported member of a zip or tar archive.
+
+    Results go to *output*, or to `<archive name>_text/` next to the
+    archive when no output is given.
+    """
+    try:
+        with open(archive_path, "rb") as f:
+            members = iter_archive_members(f)
+            if output is None:
+                output = OutputDirectory(archive_path.parent / f"{_archive_stem(archive_path)}_text")
+            _process_members(members, output.write, archive_path, logger, show_progress, detect)
+        return True
+    except Exception as e:
+        # Damage outside any single member (central directory, tar headers,
+        # compressed stream) ends the archive; member errors are logged per
+        # member in _process_members
+        if logger:
+            logger.error(f"Failed: {archive_path} - {e}")
+        return False
+
+def process_stdin(logger=None, show_progress=True, detect=True, output=None):
+    """Extract text from a document or archive read from stdin.
+
+    A single document's text is written to stdout unless *output* is
+    given; archives always need *output*.
+    """
+    try:
+        buffer = _spool(sys.stdin.buffer)
+        with buffer:
+            if _is_archive_stream(buffer):
+                if output is None:
+                    raise ValueError("Reading an archive from stdin requires --output-archive or --output-dir")
+                _process_members(iter_archive_members(buffer), output.write, "stdin", logger, show_progress, detect)
+                return True
+            if buffer.read(5) == b"%PDF-":
+                text = extract_text_from_pdf(buffer, detect=detect)
+            else:
+                text = extract_text_from_image(buffer, detect=detect)
+        if output:
+            output.write("stdin", text)
+        else:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        if logger:
+            logger.info("Success: stdin")
+        return True
+    except Exception as e:
+        if logger:
+            logger.error(f"Failed: stdin - {e}")
+        return False
+
+def setup_logger(log_file: Path = None, stream=None):
     logger = logging.getLogger("TextExtractor")
     logger.setLevel(logging.INFO)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    handlers = [logging.StreamHandler(sys.stdout)]
+    handlers = [logging.StreamHandler(stream or sys.stdout)]
     if log_file:
         handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
     for handler in handlers:
@@ -106,24 +522,59 @@ def setup_logger(log_file: Path = None):
         logger.addHandler(handler)
     return logger
 
-def main():
+def main(argv=None):
     import argparse
     parser = argparse.ArgumentParser(description="Text Extraction Tool: Extract text from images and PDFs.")
-    parser.add_argument("input", type=str, help="Input file or folder path")
+    parser.add_argument("input", type=str, help="Input file, folder, zip/tar archive, or '-' for stdin")
     parser.add_argument("--log", type=str, help="Optional log file path")
     parser.add_argument("--no-progress", action="store_true", help="Disable progress bar")
-    args = parser.parse_args()
+    destination = parser.add_mutually_exclusive_group()
+    destination.add_argument("--output-dir", type=str, help="Write results under this directory instead of next to the sources")
+    destination.add_argument("--output-archive", type=str, help="Write results into this .zip or .tar[.gz|.bz2|.xz]")
+    parser.add_argument("--shard-depth", type=int, default=0, help="With --output-dir, spread .txt files over N levels of hash-named subdirectories")
+    parser.add_argument("--pack", choices=["jsonl", "parquet"], help="With --output-dir, pack results into JSONL or Parquet shards instead of .txt files")
+    parser.add_argument("--shard-records", type=int, default=SHARD_RECORDS, help=f"Records per packed shard (default: {SHARD_RECORDS})")
+    parser.add_argument("--no-detect", action="store_true", help="Skip script/orientation and layout detection; OCR with Tesseract defaults")
+    args = parser.parse_args(argv)
+
+    if (args.shard_depth or args.pack) and not args.output_dir:
+        parser.error("--shard-depth and --pack require --output-dir")
+    if args.shard_depth and args.pack:
+        parser.error("--shard-depth cannot be combined with --pack")
+    if args.shard_depth < 0 or args.shard_records < 1:
+        parser.error("--shard-depth must be >= 0 and --shard-records >= 1")
 
-    check_tesseract_installed()
     input_path = Path(args.input)
-    logger = setup_logger(args.log)
+    reads_stdin = args.input == "-"
 
-    if input_path.is_file():
-        process_file(input_path, logger=logger)
-    elif input_path.is_dir():
-        process_folder(input_path, logger=logger, show_progress=not args.no_progress)
-    else:
-        logger.error(f"Input path not found: {input_path}")
+    check_tesseract_installed()
+    # Keep stdout clean when extracted text is written there
+    logger = setup_logger(args.log, stream=sys.stderr if reads_stdin else None)
+    try:
+        output = open_output(
+            output_dir=Path(args.output_dir) if args.output_dir else None,
+            output_archive=Path(args.output_archive) if args.output_archive else None,
+            shard_depth=args.shard_depth,
+            pack=args.pack,
+            shard_records=args.shard_records,
+        )
+    except (OSError, ValueError, ImportError) as e:
+        parser.error(str(e))
+
+    try:
+        if reads_stdin:
+            process_stdin(logger=logger, show_progress=not args.no_progress, detect=not args.no_detect, output=output)
+        elif input_path.is_file() and is_archive(input_path):
+            process_archive(input_path, logger=logger, show_progress=not args.no_progress, detect=not args.no_detect, output=output)
+        elif input_path.is_file():
+            process_file(input_path, logger=logger, detect=not args.no_detect, output=output)
+        elif input_path.is_dir():
+            process_folder(input_path, logger=logger, show_progress=not args.no_progress, detect=not args.no_detect, output=output)
+        else:
+            logger.error(f"Input path not found: {input_path}")
+    finally:
+        if output:
+            output.close()
 
 if __name__ == "__main__":
     main()
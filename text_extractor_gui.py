@@ -1,6 +1,10 @@
 import os
 import sys
+import queue
+import logging
+import tempfile
 import threading
+import collections
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, ttk, messagebox
 from pathlib import Path
@@ -13,6 +17,13 @@ from text_extractor import (
     process_folder
 )
 
+# Log view tuning: every LOG_FLUSH_MS the Tk thread renders at most
+# LOG_BATCH_MESSAGES queued messages (the rest wait for the next tick)
+# and only the newest LOG_MAX_LINES stay in the widget.
+LOG_FLUSH_MS = 100
+LOG_BATCH_MESSAGES = 500
+LOG_MAX_LINES = 2000
+
 
 class TextExtractorGUI:
     def __init__(self, root):
@@ -23,14 +34,46 @@ class TextExtractorGUI:
         
         # Variables
         self.input_path = tk.StringVar()
+        self.failures_only = tk.BooleanVar(value=False)
         self.processing = False
         
+        # Log sink: worker threads only enqueue, the Tk thread renders.
+        # Any other widget call from a worker goes through ui_queue.
+        self.log_queue = queue.SimpleQueue()
+        self.ui_queue = queue.SimpleQueue()
+        self.log_lines = collections.deque(maxlen=LOG_MAX_LINES)
+        self.failure_lines = collections.deque(maxlen=LOG_MAX_LINES)
+        self.visible_lines = 0
+        self.log_file = None
+        self.file_logger = self.setup_file_logger()
+        
         # Check Tesseract on startup
         self.check_dependencies()
         
         # Create UI
         self.create_widgets()
+        self.root.after(LOG_FLUSH_MS, self.flush_log)
         
+    def setup_file_logger(self):
+        logger = logging.getLogger("TextExtractorGUI")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        # Private per-run file (created 0600 with O_EXCL) so concurrent
+        # users and instances never share or clobber a log
+        try:
+            fd, log_file = tempfile.mkstemp(prefix="text_extractor_gui-", suffix=".log")
+            os.close(fd)
+            handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
+        except OSError:
+            return None
+        self.log_file = log_file
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+        logger.addHandler(handler)
+        return logger
+    
     def check_dependencies(self):
         try:
             check_tesseract_installed()
@@ -136,9 +179,22 @@ class TextExtractorGUI:
         )
         self.log_text.pack(fill=tk.BOTH, expand=True)
         
+        log_controls = tk.Frame(log_frame)
+        log_controls.pack(fill=tk.X, pady=(5, 0))
+        
+        tk.Checkbutton(
+            log_controls,
+            text="Failures only",
+            variable=self.failures_only,
+            command=self.render_log
+        ).pack(side=tk.LEFT)
+        
+        log_file_text = f"Full log: {self.log_file}" if self.file_logger else "Full log: unavailable"
+        tk.Label(log_controls, text=log_file_text, font=("Arial", 8), fg="#6c757d").pack(side=tk.LEFT, padx=10)
+        
         # Clear log button
         tk.Button(
-            log_frame,
+            log_controls,
             text="Clear Log",
             command=self.clear_log,
             bg="#e74c3c",
@@ -147,7 +203,7 @@ class TextExtractorGUI:
             padx=10,
             pady=3,
             cursor="hand2"
-        ).pack(pady=(5, 0))
+        ).pack(side=tk.RIGHT)
         
         # Info frame
         info_frame = tk.Frame(main_frame)
@@ -177,16 +233,84 @@ class TextExtractorGUI:
             self.log(f"Selected folder: {folder}")
     
     def log(self, message):
-        self.log_text.insert(tk.END, message + "\n")
+        # Safe to call from any thread; rendering happens in flush_log.
+        # The file write stays on the caller's thread (logging is thread-safe).
+        if self.file_logger:
+            self.file_logger.info(message)
+        self.log_queue.put(message)
+    
+    def is_failure(self, line):
+        return line.lstrip().startswith("✗")
+    
+    def flush_log(self):
+        # Reschedule first so modal dialogs opened below don't stall the log
+        self.root.after(LOG_FLUSH_MS, self.flush_log)
+        
+        new_lines = []
+        try:
+            for _ in range(LOG_BATCH_MESSAGES):
+                message = self.log_queue.get_nowait()
+                for line in message.split("\n"):
+                    entry = (self.is_failure(line), line)
+                    self.log_lines.append(entry)
+                    if entry[0]:
+                        self.failure_lines.append(entry)
+                    new_lines.append(entry)
+        except queue.Empty:
+            pass
+        
+        if new_lines:
+            if len(new_lines) >= LOG_MAX_LINES:
+                self.render_log()
+            else:
+                self.append_log(new_lines)
+        
+        status = None
+        try:
+            while True:
+                func, args = self.ui_queue.get_nowait()
+                if func == self.set_status:
+                    status = args  # Latest status wins
+                else:
+                    func(*args)
+        except queue.Empty:
+            pass
+        if status is not None:
+            self.set_status(*status)
+    
+    def append_log(self, entries):
+        lines = [line for failed, line in entries if failed or not self.failures_only.get()]
+        if not lines:
+            return
+        self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+        self.visible_lines += len(lines)
+        excess = self.visible_lines - LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self.visible_lines = LOG_MAX_LINES
         self.log_text.see(tk.END)
-        self.root.update_idletasks()
+    
+    def render_log(self):
+        self.log_text.delete(1.0, tk.END)
+        self.visible_lines = 0
+        self.append_log(self.failure_lines if self.failures_only.get() else self.log_lines)
     
     def clear_log(self):
+        self.log_lines.clear()
+        self.failure_lines.clear()
         self.log_text.delete(1.0, tk.END)
+        self.visible_lines = 0
     
     def update_status(self, message):
+        # Safe to call from any thread; applied on the next flush
+        self.call_in_ui(self.set_status, message)
+    
+    def set_status(self, message):
         self.status_label.config(text=message)
-        self.root.update_idletasks()
+    
+    def call_in_ui(self, func, *args):
+        # Run func(*args) on the Tk thread on the next flush
+        self.ui_queue.put((func, args))
     
     def process_input(self):
         if self.processing:
@@ -203,16 +327,16 @@ class TextExtractorGUI:
             messagebox.showerror("Error", f"Path does not exist: {path}")
             return
         
+        self.processing = True
+        self.process_btn.config(state=tk.DISABLED)
+        self.progress_bar.start(10)
+        
         # Start processing in a separate thread
         thread = threading.Thread(target=self.process_thread, args=(input_path,))
         thread.daemon = True
         thread.start()
     
     def process_thread(self, input_path):
-        self.processing = True
-        self.process_btn.config(state=tk.DISABLED)
-        self.progress_bar.start(10)
-        
         try:
             if input_path.is_file():
                 self.update_status(f"Processing file: {input_path.name}")
@@ -232,17 +356,20 @@ class TextExtractorGUI:
                 self.process_folder_files(input_path)
                 self.update_status("Folder processing completed!")
             
-            messagebox.showinfo("Complete", "Processing completed! Check the log for details.")
+            self.call_in_ui(messagebox.showinfo, "Complete", "Processing completed! Check the log for details.")
             
         except Exception as e:
             self.log(f"✗ Error: {str(e)}")
             self.update_status("Error occurred during processing")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            self.call_in_ui(messagebox.showerror, "Error", f"An error occurred: {str(e)}")
         
         finally:
-            self.progress_bar.stop()
-            self.processing = False
-            self.process_btn.config(state=tk.NORMAL)
+            self.call_in_ui(self.finish_processing)
+    
+    def finish_processing(self):
+        self.progress_bar.stop()
+        self.processing = False
+        self.process_btn.config(state=tk.NORMAL)
     
     def process_single_file(self, file_path):
         try: